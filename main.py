@@ -7,7 +7,7 @@ in-memory SQLite database for fast searching. The application is designed to wor
 workers in a production environment (e.g., Gunicorn) by using SQLite's shared memory mode.
 
 Key Features:
-- Real-time card search with name and description matching
+- Real-time card search with name and description matching (SQLite FTS5)
 - Card image viewing and caching
 - Progress tracking during database initialization
 - Error handling and status reporting
@@ -22,14 +22,24 @@ Dependencies:
 
 import sqlite3
 import os
+import tempfile
 import requests
-from tqdm import tqdm
-from flask import Flask, render_template, request, jsonify, send_file, g
-import json
-from threading import Thread, Lock
-from io import BytesIO
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
+import orjson
+import ijson
+from threading import Thread, Lock, local
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timezone
 import logging
+import hashlib
+from functools import lru_cache
+from operator import itemgetter
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
 
 # Configure logging to track application behavior and errors
 logging.basicConfig(level=logging.INFO)
@@ -37,10 +47,78 @@ logger = logging.getLogger(__name__)
 
 # Use shared memory SQLite for multi-worker support
 # This allows all Gunicorn workers to access the same database
-DB_URI = "file:cards_db?mode=memory&cache=shared"
-image_cache = {}  # In-memory cache for card images
-db_lock = Lock()  # Thread-safe lock for database operations
-initialized = False  # Flag to track if database has been initialized
+DB_URI = os.environ.get('DB_URI', "file:cards_db?mode=memory&cache=shared")
+# Card images live under the app's static folder so they can be served as files
+IMAGES_DIR = os.environ.get(
+    'IMAGES_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "static", "card_images")
+)
+IMAGE_CHUNK_SIZE = 64 * 1024  # Chunk size used when streaming image downloads
+IMAGE_MAX_AGE = 365 * 24 * 60 * 60  # Cache-Control max-age for card images, in seconds
+# Read the process umask once (os.umask can only be read by setting it) so
+# downloaded images get the same permissions open() would have given them
+_umask = os.umask(0o022)
+os.umask(_umask)
+IMAGE_FILE_MODE = 0o666 & ~_umask  # Permissions for images written to IMAGES_DIR
+# On-disk copy of the populated database; workers restore from it instead of
+# re-fetching the API until it is older than SNAPSHOT_MAX_AGE seconds
+SNAPSHOT_PATH = os.environ.get(
+    'SNAPSHOT_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "cards_snapshot.db")
+)
+SNAPSHOT_MAX_AGE = int(os.environ.get('SNAPSHOT_MAX_AGE', 24 * 60 * 60))
+# Layout version stored in _meta; bump it whenever tables, indexes or the FTS
+# tokenizer change so snapshots written by older code are not restored
+SCHEMA_VERSION = "2"
+# Lock file that serializes API loads across worker processes
+INIT_LOCK_PATH = f"{SNAPSHOT_PATH}.lock"
+# Download every missing card image in the background once the database is ready
+PREFETCH_IMAGES = os.environ.get('PREFETCH_IMAGES', '').lower() in ('1', 'true', 'yes')
+# Lock file that lets only one worker process run the image prefetch
+PREFETCH_LOCK_PATH = f"{SNAPSHOT_PATH}.prefetch.lock"
+fts_enabled = False  # Whether the FTS5 search index was created
+image_progress_lock = Lock()  # Guards image download counters updated from worker threads
+_tls = local()  # Per-thread read-only database connections used by requests
+_inflight = {}  # card_id -> Future for image downloads currently in progress
+_inflight_lock = Lock()  # Guards _inflight
+_index_cache = {}  # db_status state -> rendered index page
+_card_fields = itemgetter('id', 'name', 'type', 'desc')  # Column values pulled from each card in one C call
+
+# Request-path SQL is kept as module constants so the text is identical on every
+# call and hits the connection's prepared statement cache
+SEARCH_LIMIT = 100  # Maximum number of cards returned by a search
+SEARCH_MIN_LENGTH = 2  # Shorter queries return no results
+SEARCH_FTS_SQL = f"""
+    SELECT '[' || ifnull(group_concat(card_data), '') || ']' FROM (
+        SELECT cards.card_data FROM cards_fts
+        JOIN cards ON cards.id = cards_fts.rowid
+        WHERE cards_fts MATCH ?
+        ORDER BY cards_fts.rank
+        LIMIT {SEARCH_LIMIT}
+    )
+"""
+SEARCH_LIKE_SQL = f"""
+    SELECT '[' || ifnull(group_concat(card_data), '') || ']' FROM (
+        SELECT card_data FROM cards
+        WHERE instr(name_lc, lower(?1)) > 0 OR instr(desc_lc, lower(?1)) > 0
+        LIMIT {SEARCH_LIMIT}
+    )
+"""
+# The planner prefers the rowid lookup, so the covering index is named explicitly
+CARD_SQL = "SELECT image_url FROM cards INDEXED BY idx_cards_id_img WHERE id=?"
+
+# Shared HTTP session so API and image requests reuse pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.2)
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+# (connect, read) timeouts: fail fast on unreachable hosts so a stalled connect
+# does not hold a pooled slot for the full read timeout
+HTTP_TIMEOUT = (5, 30)
 
 app = Flask(__name__)
 
@@ -53,27 +131,173 @@ db_status = {
     "message": "Database not initialized",  # User-friendly status message
     "progress": 0,           # Progress percentage (0-100)
     "error": None,           # Error message if something goes wrong
-    "last_updated": None     # Timestamp of last update
+    "total_images": 0,       # Number of card images to download
+    "current_image": 0,      # Number of card images downloaded
+    "last_updated": None     # Timestamp of last update (UTC)
 }
 
+def _set_status(changes):
+    """
+    Publish a new db_status by swapping in an updated copy instead of mutating
+    the shared dict. Rebinding a module global is atomic, so readers that grab
+    db_status once always see a consistent snapshot.
+    """
+    global db_status
+    if "state" in changes and changes["state"] != db_status["state"]:
+        _index_cache.clear()
+    db_status = {**db_status, **changes}
+
 def get_db():
     """
-    Get a database connection for the current request.
-    Uses Flask's application context to ensure each request gets its own connection.
-    Connections are automatically closed when the request ends.
+    Get the read-only database connection for the current thread.
+    Each worker thread opens one connection on first use and keeps it, so
+    requests do not reconnect to the shared-memory database every time.
+    """
+    conn = getattr(_tls, 'conn', None)
+    if conn is None:
+        # Request connections only read, so autocommit mode avoids implicit transactions
+        conn = sqlite3.connect(DB_URI, uri=True, cached_statements=256, isolation_level=None)
+        # Mark the connection read-only and, since the cards never change once
+        # loaded, let it skip shared-cache table read locks
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute("PRAGMA read_uncommitted=ON")
+        _tls.conn = conn
+    return conn
+
+def _card_rows(cards, raw, total_bytes):
+    """
+    Yield INSERT parameters for each card, storing the complete card data as
+    JSON for flexibility. The encoded JSON is passed as bytes and converted to
+    TEXT by SQLite in C, avoiding a Python-level decode per card.
+
+    Cards arrive from a streaming parser, so progress is estimated from the
+    bytes read off the wire and published every 1024 cards rather than per
+    card to keep status bookkeeping off the insert path.
+    """
+    for i, c in enumerate(cards):
+        if i & 1023 == 0:
+            progress = min(90, 20 + (70 * raw.tell() // total_bytes)) if total_bytes else 20
+            _set_status({
+                "current_card": i,
+                "message": f"Processing cards ({i} so far)",
+                "progress": progress
+            })
+        yield (*_card_fields(c), orjson.dumps(c), c['card_images'][0]['image_url'])
+
+def _create_indexes(conn):
+    """
+    Create the secondary indexes on a populated cards table.
+    idx_cards_id_img covers the image URL lookup, so /card/<id> reads a small
+    index entry instead of a table row that also holds the multi-KB card JSON.
+    """
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_cards_id_img ON cards(id, image_url)")
+    conn.commit()
+
+def _acquire_init_lock():
+    """
+    Take an exclusive flock on INIT_LOCK_PATH so only one worker process at a
+    time fetches card data and writes the snapshot. Returns the locked file
+    descriptor, or None on platforms without fcntl or if the lock file cannot
+    be used, in which case each worker loads independently.
+    """
+    if fcntl is None:
+        return None
+    try:
+        fd = os.open(INIT_LOCK_PATH, os.O_CREAT | os.O_RDWR)
+    except OSError as e:
+        logger.warning(f"Cannot open init lock {INIT_LOCK_PATH}, loading without it: {e}")
+        return None
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.info("Another worker is loading card data, waiting for it to finish...")
+            _set_status({"message": "Waiting for another worker to load card data..."})
+            fcntl.flock(fd, fcntl.LOCK_EX)
+    except OSError as e:
+        logger.warning(f"Cannot lock {INIT_LOCK_PATH}, loading without it: {e}")
+        os.close(fd)
+        return None
+    return fd
+
+def _try_prefetch_lock():
+    """
+    Try to take a non-blocking exclusive flock on PREFETCH_LOCK_PATH so only
+    one worker process downloads the image catalog. Returns a (fd, acquired)
+    pair: acquired is False only when another worker holds the lock. As with
+    _acquire_init_lock, fd is None when locking is unavailable (no fcntl or an
+    unusable lock file) and the caller prefetches without it.
+    """
+    if fcntl is None:
+        return None, True
+    try:
+        fd = os.open(PREFETCH_LOCK_PATH, os.O_CREAT | os.O_RDWR)
+    except OSError as e:
+        logger.warning(f"Cannot open prefetch lock {PREFETCH_LOCK_PATH}, prefetching without it: {e}")
+        return None, True
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        os.close(fd)
+        return None, False
+    except OSError as e:
+        logger.warning(f"Cannot lock {PREFETCH_LOCK_PATH}, prefetching without it: {e}")
+        os.close(fd)
+        return None, True
+    return fd, True
+
+def _snapshot_is_fresh():
+    """Return True if a snapshot exists and is younger than SNAPSHOT_MAX_AGE seconds."""
+    try:
+        age = datetime.now().timestamp() - os.path.getmtime(SNAPSHOT_PATH)
+    except OSError:
+        return False
+    return age < SNAPSHOT_MAX_AGE
+
+def _restore_snapshot(conn):
+    """
+    Copy the on-disk snapshot into the database behind conn using the backup API.
+    Returns False, leaving conn untouched, if the snapshot was written with a
+    different SCHEMA_VERSION or cannot be read; unreadable snapshots are deleted
+    so later starts do not trip over them again.
     """
-    if 'db' not in g:
-        g.db = sqlite3.connect(DB_URI, uri=True)
-    return g.db
+    logger.info(f"Restoring database from snapshot {SNAPSHOT_PATH}...")
+    try:
+        src = sqlite3.connect(SNAPSHOT_PATH)
+        try:
+            row = src.execute("SELECT value FROM _meta WHERE key = 'schema_version'").fetchone()
+            if row is None or row[0] != SCHEMA_VERSION:
+                logger.info(f"Ignoring snapshot written with a different schema version (want {SCHEMA_VERSION})")
+                return False
+            src.backup(conn)
+        finally:
+            src.close()
+    except sqlite3.Error as e:
+        logger.warning(f"Failed to restore snapshot {SNAPSHOT_PATH}, discarding it: {e}")
+        try:
+            os.remove(SNAPSHOT_PATH)
+        except OSError:
+            pass
+        return False
+    return True
 
-@app.teardown_appcontext
-def close_db(error):
+def _save_snapshot(conn):
     """
-    Close the database connection when the request ends.
-    This prevents connection leaks and ensures proper cleanup.
+    Write the populated database to SNAPSHOT_PATH using the backup API.
+    The copy is written to a temporary file and moved into place, so other
+    workers never restore from a partially written snapshot.
     """
-    if 'db' in g:
-        g.db.close()
+    tmp_path = f"{SNAPSHOT_PATH}.tmp"
+    try:
+        disk = sqlite3.connect(tmp_path)
+        try:
+            conn.backup(disk)
+        finally:
+            disk.close()
+        os.replace(tmp_path, SNAPSHOT_PATH)
+        logger.info(f"Saved database snapshot to {SNAPSHOT_PATH}")
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"Failed to save database snapshot: {e}")
 
 def initialize_database():
     """
@@ -81,115 +305,309 @@ def initialize_database():
     This function:
     1. Creates the cards table if it doesn't exist
     2. Fetches card data from the API
-    3. Processes cards in batches for better performance
+    3. Inserts all cards in a single transaction for better performance
     4. Updates status and progress for the frontend
+    5. Saves a snapshot to disk, which later calls restore instead of re-fetching
     
-    The function is thread-safe and will only initialize once, even with multiple workers.
+    Initialization is claimed through a sentinel row in the _meta table, so callers
+    sharing the database only populate it once.
     """
-    global db_status, initialized
+    global fts_enabled
+    conn = None
+    claimed = False
+    lock_fd = None
     try:
         logger.info("Starting database initialization...")
-        with db_lock:  # Ensure only one worker initializes the database
-            if initialized:
-                logger.info("Database already initialized")
-                return
-                
-            db_status.update({
-                "state": "initializing",
-                "message": "Initializing database...",
-                "progress": 0,
-                "error": None
+
+        # Create shared memory database connection
+        logger.info("Creating database connection...")
+        # Keep-alive connection prevents the shared memory from being cleared.
+        # It is stored on the app so it lives for the whole process instead of
+        # being closed when this function returns.
+        if '_ka_conn' not in app.config:
+            app.config['_ka_conn'] = sqlite3.connect(DB_URI, uri=True)
+        conn = sqlite3.connect(DB_URI, uri=True)
+        cursor = conn.cursor()
+
+        # The database is fully rebuildable from the API, so skip durability
+        # work: no syncing, journal and temp storage kept in memory
+        cursor.executescript('''
+            PRAGMA synchronous=OFF;
+            PRAGMA journal_mode=MEMORY;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+        ''')
+
+        # Claim initialization with an atomic sentinel insert. Only the caller
+        # whose insert succeeds populates the database; everyone else returns
+        # and follows progress through db_status.
+        cursor.execute("CREATE TABLE IF NOT EXISTS _meta (key TEXT PRIMARY KEY, value TEXT)")
+        cursor.execute("INSERT OR IGNORE INTO _meta (key, value) VALUES ('init', '1')")
+        claimed = cursor.rowcount == 1
+        conn.commit()
+        if not claimed:
+            logger.info("Database initialization already claimed")
+            return
+
+        _set_status({
+            "state": "initializing",
+            "message": "Initializing database...",
+            "progress": 0,
+            "error": None
+        })
+
+        # Only one worker process loads from the API at a time; the others wait
+        # here and then restore the snapshot it wrote
+        lock_fd = _acquire_init_lock()
+
+        # A recent snapshot restores in a fraction of the time a full API fetch
+        # takes; an unusable one falls through to the API load below
+        if _snapshot_is_fresh() and _restore_snapshot(conn):
+            fts_enabled = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'cards_fts'"
+            ).fetchone() is not None
+            total_cards = cursor.execute("SELECT count(*) FROM cards").fetchone()[0]
+
+            _search_cached.cache_clear()
+            logger.info("Database restored from snapshot")
+            _set_status({
+                "state": "ready",
+                "total_cards": total_cards,
+                "current_card": total_cards,
+                "message": f"Database ready with {total_cards} cards",
+                "progress": 100,
+                "last_updated": datetime.fromtimestamp(os.path.getmtime(SNAPSHOT_PATH), timezone.utc).isoformat()
             })
-            
-            # Create shared memory database connection
-            logger.info("Creating database connection...")
-            # Keep-alive connection prevents the shared memory from being cleared
-            keep_alive_conn = sqlite3.connect(DB_URI, uri=True)
-            conn = sqlite3.connect(DB_URI, uri=True)
-            cursor = conn.cursor()
-            
-            # Create the cards table with all necessary fields
-            logger.info("Creating tables...")
+            return
+
+        logger.info("Creating tables...")
+
+        # Full-text index over name and description so searches use an
+        # inverted index instead of scanning every row. SQLite builds
+        # without FTS5 fall back to substring searches. The external-content
+        # table only reads cards at query time, so it can be created first.
+        try:
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS cards (
-                    id INTEGER PRIMARY KEY,
-                    name TEXT,
-                    type TEXT,
-                    desc TEXT,
-                    card_data TEXT,
-                    image_url TEXT
+                CREATE VIRTUAL TABLE IF NOT EXISTS cards_fts USING fts5(
+                    name,
+                    desc,
+                    content='cards',
+                    content_rowid='id',
+                    tokenize='porter unicode61'
                 )
             ''')
-            conn.commit()
-            
-            # Fetch card data from the YGOPRODeck API
-            logger.info("Fetching card data from API...")
-            db_status.update({
-                "state": "updating",
-                "message": "Fetching card data from API...",
-                "progress": 10
-            })
-            
-            response = requests.get('https://db.ygoprodeck.com/api/v7/cardinfo.php', timeout=30)
+            fts_enabled = True
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 unavailable, falling back to substring search: {e}")
+            fts_enabled = False
+
+        # Create the cards table with all necessary fields. Lowercased copies of
+        # name and description are only needed by the substring fallback, so
+        # they are left out when FTS5 handles searches.
+        fallback_columns = "" if fts_enabled else ''',
+                name_lc TEXT GENERATED ALWAYS AS (lower(name)) STORED,
+                desc_lc TEXT GENERATED ALWAYS AS (lower(desc)) STORED'''
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS cards (
+                id INTEGER PRIMARY KEY,
+                name TEXT,
+                type TEXT,
+                desc TEXT,
+                card_data TEXT,
+                image_url TEXT{fallback_columns}
+            )
+        ''')
+        conn.commit()
+        
+        # Fetch card data from the YGOPRODeck API
+        logger.info("Fetching card data from API...")
+        _set_status({
+            "state": "updating",
+            "message": "Fetching card data from API...",
+            "progress": 10
+        })
+        
+        # Stream the response and parse the card array incrementally, so the
+        # full payload and card list are never held in memory at once
+        with SESSION.get('https://db.ygoprodeck.com/api/v7/cardinfo.php', stream=True, timeout=HTTP_TIMEOUT) as response:
             if response.status_code != 200:
                 raise Exception(f"API returned status code {response.status_code}")
-                
-            cards = response.json().get('data', [])
-            if not cards:
-                raise Exception("No card data received from API")
-                
-            logger.info(f"Received {len(cards)} cards from API")
-            db_status.update({
-                "total_cards": len(cards),
-                "message": f"Processing {len(cards)} cards...",
+
+            response.raw.decode_content = True
+            total_bytes = int(response.headers.get('Content-Length') or 0)
+            cards = ijson.items(response.raw, 'data.item', use_float=True)
+
+            # Feed parsed cards straight into a single executemany inside one
+            # explicit transaction; progress is published from the row generator
+            _set_status({
+                "message": "Processing cards...",
                 "progress": 20
             })
-            
-            # Process cards in batches for better performance and progress updates
-            batch_size = 100
-            for i in range(0, len(cards), batch_size):
-                batch = cards[i:i+batch_size]
-                for card in batch:
-                    db_status["current_card"] += 1
-                    progress = min(90, 20 + (70 * db_status["current_card"] // len(cards)))
-                    db_status.update({
-                        "message": f"Processing cards ({db_status['current_card']}/{db_status['total_cards']})",
-                        "progress": progress
-                    })
-                    
-                    # Store complete card data as JSON for flexibility
-                    card_data = json.dumps(card)
-                    image_url = card['card_images'][0]['image_url']
-                    
-                    cursor.execute('''
-                        INSERT INTO cards (id, name, type, desc, card_data, image_url)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    ''', (card['id'], card['name'], card['type'], card['desc'], card_data, image_url))
-                
-                conn.commit()
-                logger.info(f"Processed batch of {len(batch)} cards. Total progress: {progress}%")
-            
-            initialized = True
-            logger.info("Database initialization completed successfully")
-            db_status.update({
-                "state": "ready",
-                "message": f"Database ready with {db_status['total_cards']} cards",
-                "progress": 100,
-                "last_updated": datetime.now().isoformat()
-            })
-            
+            cursor.execute("BEGIN")
+            cursor.executemany('''
+                INSERT INTO cards (id, name, type, desc, card_data, image_url)
+                VALUES (?, ?, ?, ?, CAST(? AS TEXT), ?)
+            ''', _card_rows(cards, response.raw, total_bytes))
+            total_cards = cursor.rowcount
+
+        if total_cards <= 0:
+            raise Exception("No card data received from API")
+
+        logger.info(f"Inserted {total_cards} cards")
+        _set_status({
+            "total_cards": total_cards,
+            "current_card": total_cards
+        })
+
+        # Populate the full-text index from the freshly loaded cards
+        if fts_enabled:
+            cursor.execute("INSERT INTO cards_fts (rowid, name, desc) SELECT id, name, desc FROM cards")
+        cursor.execute(
+            "INSERT OR REPLACE INTO _meta (key, value) VALUES ('schema_version', ?)",
+            (SCHEMA_VERSION,)
+        )
+        conn.commit()
+
+        # Build secondary indexes only once the table is populated, which is
+        # much cheaper than maintaining them on every insert
+        _create_indexes(conn)
+
+        _save_snapshot(conn)
+        _search_cached.cache_clear()
+
+        logger.info("Database initialization completed successfully")
+        _set_status({
+            "state": "ready",
+            "message": f"Database ready with {db_status['total_cards']} cards",
+            "progress": 100,
+            "last_updated": datetime.now(timezone.utc).isoformat()
+        })
+        
     except Exception as e:
         error_msg = str(e)
         logger.error(f"Error during initialization: {error_msg}", exc_info=True)
-        db_status.update({
+        _set_status({
             "state": "error",
             "message": "Failed to initialize database",
             "error": error_msg
         })
+        # Release the sentinel so a later call can retry the initialization
+        if claimed:
+            conn.rollback()
+            conn.execute("DELETE FROM _meta WHERE key = 'init'")
+            conn.commit()
+    finally:
+        if lock_fd is not None:
+            # Closing the descriptor releases the lock
+            os.close(lock_fd)
+
+def _image_filename(card_id):
+    """Return the file name a card's image is stored under in IMAGES_DIR."""
+    return f"{card_id}.jpg"
+
+def _download_image(card_id, url):
+    """
+    Download a card image into IMAGES_DIR, streaming the body straight to
+    disk instead of buffering it in memory. Returns True if the image was saved.
+    Network failures, including ones mid-body, raise requests.RequestException.
+
+    IMAGES_DIR is the image cache shared by every worker and kept across
+    restarts, so the body is written to a temporary file and renamed into
+    place; other workers never see a partially written image.
+    """
+    with SESSION.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+        if response.status_code != 200:
+            logger.warning(f"Image for card {card_id} returned status code {response.status_code}")
+            return False
+        tmp = tempfile.NamedTemporaryFile(dir=IMAGES_DIR, suffix='.tmp', delete=False)
+        try:
+            with tmp:
+                # iter_content rather than response.raw, so a stalled or
+                # truncated body surfaces as a requests exception
+                for chunk in response.iter_content(IMAGE_CHUNK_SIZE):
+                    tmp.write(chunk)
+                # NamedTemporaryFile creates files as 0600, which other readers
+                # of IMAGES_DIR (nginx, workers running as another user) cannot open
+                os.fchmod(tmp.fileno(), IMAGE_FILE_MODE)
+            os.replace(tmp.name, os.path.join(IMAGES_DIR, _image_filename(card_id)))
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
+    return True
+
+def _download_image_once(card_id, url):
+    """
+    Download a card image, collapsing concurrent requests for the same card
+    into a single upstream fetch. The first caller downloads; callers that
+    arrive while it is in flight wait on its Future and share the result.
+    """
+    with _inflight_lock:
+        future = _inflight.get(card_id)
+        owner = future is None
+        if owner:
+            future = Future()
+            _inflight[card_id] = future
+
+    if not owner:
+        # No timeout of its own: the owner's download is already bounded by
+        # HTTP_TIMEOUT and its retries, and always resolves the Future
+        return future.result()
+
+    try:
+        saved = _download_image(card_id, url)
+        future.set_result(saved)
+        return saved
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[card_id]
+
+def _fetch_and_write(item):
+    """Download a single card image for download_card_images and record progress."""
+    card_id, url = item
+    try:
+        _download_image(card_id, url)
+    except requests.RequestException as e:
+        logger.warning(f"Failed to download image for card {card_id}: {e}")
+
+    with image_progress_lock:
+        _set_status({"current_image": db_status["current_image"] + 1})
+
+def download_card_images():
+    """
+    Download every card image that is not already present in IMAGES_DIR.
+    Image fetches are I/O bound, so they are spread over a thread pool that
+    shares the pooled keep-alive connections of SESSION.
+    """
+    os.makedirs(IMAGES_DIR, exist_ok=True)
+
+    conn = sqlite3.connect(DB_URI, uri=True)
+    try:
+        cards = conn.execute("SELECT id, image_url FROM cards").fetchall()
+    finally:
+        conn.close()
+
+    missing_images = [
+        (card_id, url) for card_id, url in cards
+        if not os.path.exists(os.path.join(IMAGES_DIR, _image_filename(card_id)))
+    ]
+    logger.info(f"Downloading {len(missing_images)} missing card images...")
+    _set_status({
+        "total_images": len(missing_images),
+        "current_image": 0
+    })
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for _ in executor.map(_fetch_and_write, missing_images):
+            pass
+
+    logger.info("Card image download completed")
 
 class DatabaseInitMiddleware:
     """
-    WSGI middleware that ensures the database is initialized before handling any requests.
+    WSGI middleware that starts database initialization when the first request arrives.
     This replaces the deprecated @app.before_first_request decorator and works with multiple workers.
     """
     def __init__(self, app):
@@ -198,23 +616,73 @@ class DatabaseInitMiddleware:
 
     def __call__(self, environ, start_response):
         if not self._db_initialized:
-            with app.app_context():
-                initialize_database()
+            # Initialize in the background so the first requests are not held up;
+            # the frontend polls /db-status until the database is ready
             self._db_initialized = True
+            Thread(target=self._initialize, daemon=True).start()
         return self.app(environ, start_response)
 
+    def _initialize(self):
+        with app.app_context():
+            initialize_database()
+            # Optionally warm the image directory so first views of a card do
+            # not wait on an upstream download
+            if PREFETCH_IMAGES and db_status["state"] == "ready":
+                # Every worker gets here at about the same time; only the one
+                # holding the prefetch lock downloads, the rest skip it
+                lock_fd, acquired = _try_prefetch_lock()
+                if not acquired:
+                    logger.info("Another worker is prefetching card images, skipping")
+                    return
+                try:
+                    download_card_images()
+                finally:
+                    if lock_fd is not None:
+                        os.close(lock_fd)
+
 # Apply the database initialization middleware
 app.wsgi_app = DatabaseInitMiddleware(app.wsgi_app)
 
 @app.route('/db-status')
 def get_db_status():
     """Return the current database initialization status."""
-    return jsonify(db_status)
+    return Response(orjson.dumps(db_status), mimetype='application/json')
 
 @app.route('/')
 def index():
-    """Render the main page with the current database status."""
-    return render_template("index.html", db_status=db_status)
+    """
+    Render the main page with the current database status.
+    The status only changes state a handful of times over the app's lifetime,
+    so the rendered HTML is cached per state and re-rendered after a transition.
+    """
+    status = db_status
+    html = _index_cache.get(status["state"])
+    if html is None:
+        html = render_template("index.html", db_status=status)
+        _index_cache[status["state"]] = html
+    return html
+
+@lru_cache(maxsize=1024)
+def _search_cached(query):
+    """
+    Run a search and return the serialized JSON body with its ETag.
+    Autocomplete sends the same short queries over and over, so results are
+    memoized per query string and cleared whenever the database is (re)loaded.
+    """
+    # The stored card JSON is concatenated into the response array by SQLite,
+    # so matches are never parsed and re-serialized in Python
+    conn = get_db()
+    if fts_enabled:
+        # Quote the query as an FTS5 phrase so user input is never parsed as query
+        # syntax; the trailing * turns the last word into a prefix match for autocomplete
+        phrase = '"' + query.replace('"', '""') + '"*'
+        row = conn.execute(SEARCH_FTS_SQL, (phrase,)).fetchone()
+    else:
+        # Substring match against the lowercased generated columns
+        row = conn.execute(SEARCH_LIKE_SQL, (query,)).fetchone()
+
+    body = row[0].encode()
+    return body, hashlib.sha1(body).hexdigest()
 
 @app.route('/search')
 def search():
@@ -224,76 +692,95 @@ def search():
     
     Query Parameters:
     - query: The search term to look for in card names and descriptions
+      (at least 2 characters; at most 100 cards are returned)
     
     Returns:
     - 503: If the database is not ready
+    - 304: If the client's cached copy is still current
     - 200: JSON array of matching cards
     """
-    if db_status["state"] != "ready":
+    status = db_status
+    if status["state"] != "ready":
         return jsonify({
             "error": "Database is not ready yet",
-            "status": db_status["state"],
-            "message": db_status["message"]
+            "status": status["state"],
+            "message": status["message"]
         }), 503
         
+    # Single characters match most of the catalog and are not worth a query
     query = request.args.get('query', '').strip()
-    if not query:
+    if len(query) < SEARCH_MIN_LENGTH:
         return jsonify([])
 
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute("""
-        SELECT card_data FROM cards 
-        WHERE name LIKE ? OR desc LIKE ?
-    """, (f'%{query}%', f'%{query}%'))
-    
-    results = cursor.fetchall()
-    cards = [json.loads(row[0]) for row in results]
-    return jsonify(cards)
+    body, etag = _search_cached(query)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.last_modified = datetime.fromisoformat(status["last_updated"])
+    return response.make_conditional(request)
+
+def _image_cache_headers(response, etag):
+    """Mark a card image response as immutable and tag it with its ID-based ETag."""
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = IMAGE_MAX_AGE
+    response.cache_control.immutable = True
+    return response
 
 @app.route('/card/<int:card_id>')
 def get_card_image(card_id):
     """
     Retrieve a card's image by its ID.
-    Images are cached in memory after first request.
+    Images are downloaded to IMAGES_DIR on first request and served from disk afterwards.
     
     Parameters:
     - card_id: The ID of the card to retrieve
     
     Returns:
+    - 304: If the client already holds this card's image
     - 503: If the database is not ready
     - 404: If the card or image is not found
     - 200: The card image file
     """
+    # The ETag is derived from the ID alone, so a matching client copy can be
+    # confirmed without touching the database or the disk
+    etag = f"card-{card_id}"
+    if request.if_none_match.contains(etag):
+        return _image_cache_headers(Response(status=304), etag)
+
     if db_status["state"] != "ready":
         return jsonify({"error": "Database not ready"}), 503
         
-    # Check if image is in cache
-    if card_id in image_cache:
-        return send_file(
-            BytesIO(image_cache[card_id]),
-            mimetype='image/jpeg'
-        )
-    
-    # Get image URL from database
-    conn = get_db()
-    cursor = conn.cursor()
-    cursor.execute("SELECT image_url FROM cards WHERE id=?", (card_id,))
-    result = cursor.fetchone()
-    
-    if not result:
-        return "Card not found", 404
-        
-    # Download and cache image
-    response = requests.get(result[0])
-    if response.status_code == 200:
-        image_cache[card_id] = response.content
-        return send_file(
-            BytesIO(response.content),
-            mimetype='image/jpeg'
-        )
-    
-    return "Image not found", 404
+    # Images already on disk are served straight from the file
+    filename = _image_filename(card_id)
+    if not os.path.exists(os.path.join(IMAGES_DIR, filename)):
+        # Get image URL from database
+        result = get_db().execute(CARD_SQL, (card_id,)).fetchone()
+
+        if not result:
+            return "Card not found", 404
+
+        os.makedirs(IMAGES_DIR, exist_ok=True)
+        try:
+            saved = _download_image_once(card_id, result[0])
+        except requests.RequestException as e:
+            logger.warning(f"Failed to download image for card {card_id}: {e}")
+            saved = False
+        if not saved:
+            return "Image not found", 404
+
+    # send_from_directory hands the open file to the WSGI server, which can use
+    # sendfile(2) instead of copying the bytes through Python. Card art never
+    # changes for a given ID, so clients may cache it for a year without
+    # revalidating.
+    response = send_from_directory(
+        IMAGES_DIR,
+        filename,
+        mimetype='image/jpeg',
+        conditional=True,
+        etag=False,
+        max_age=IMAGE_MAX_AGE
+    )
+    return _image_cache_headers(response, etag)
 
 if __name__ == "__main__":
     # When running directly (not through Gunicorn)
@@ -5,6 +5,11 @@ This file serves as the entry point for WSGI servers (e.g., Gunicorn) to run the
 The database initialization is handled by the DatabaseInitMiddleware in main.py, which ensures
 that the database is properly initialized even with multiple workers.
 
+Do not call initialize_database() from this module. With Gunicorn's --preload it
+would run once in the master process, and SQLite connections and shared-memory
+databases must not be carried across fork(). The middleware starts initialization
+lazily on the first request, which always happens inside a worker.
+
 Usage:
     gunicorn wsgi:application
 """